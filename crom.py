@@ -31,6 +31,7 @@ class Crom:
         else:
             self._crossover_method = cross_meth
 
+        self._fitness = None
         self._generate_program()
 
 ####
@@ -61,7 +62,7 @@ class Crom:
                 choice = self._genes[j]
                 replacement = self._grammar[item, choice]
                 replacement = re.split(VARIABLE_FORMAT, replacement)
-                prg_list = prg_list[0:i] + replacement + prg_list[i+1:]
+                prg_list[i:i+1] = replacement
                 extended_cromosom.append(self._dict_meta[item])
                 j += 1
             else:
@@ -76,12 +77,16 @@ class Crom:
 ####
 
     def eval_fitness(self):
-        if self._valid:
-            fitness = self._problem.eval_fitness(self._program)
-        else:
-            fitness = self._problem.get_fitness_fail()
+        """ El fitness depende solo del programa, que no cambia
+            una vez creado el cromosoma, asi que se calcula una vez.
+        """
+        if self._fitness is None:
+            if self._valid:
+                self._fitness = self._problem.eval_fitness(self._program)
+            else:
+                self._fitness = self._problem.get_fitness_fail()
 
-        return fitness
+        return self._fitness
 
 ####
 
@@ -4,12 +4,16 @@ import math
 import pylab
 from random import randint, random, choice
 from copy import copy
+from operator import attrgetter
 from pprint import pprint
 from problem import Problem
 from grammar import Grammar
 from crom import Crom
 
-class Pair:
+FITNESS_KEY = attrgetter('fitness')
+
+class Pair(object):
+    __slots__ = ('indice', 'fitness')
     def __init__(self, i, f):
         self.indice, self.fitness = i, f
     def __cmp__(self, p2):
@@ -35,6 +39,13 @@ class Poblacion:
         self._prob_mutacion = pm
         self._tipo_mutacion = tm
         assert(isinstance(self._tipo_mutacion, str))
+        # El tipo de mutacion se resuelve una sola vez, no en cada cruza
+        if self._tipo_mutacion == 'simple':
+            self._mutate = self._mutate_simple
+        elif self._tipo_mutacion == 'multiple':
+            self._mutate = self._mutate_multiple
+        else:
+            raise Exception, "Tipo de mutacion invalido: %s" % self._tipo_mutacion
         self._brecha_gen = bg
         self._elitismo = elit
         self._crossover_method = cm
@@ -50,20 +61,22 @@ class Poblacion:
 ####
 
     def _compute_fitness_list(self, individuos):
+        """ Devuelve la lista de Pairs ordenada de mejor a peor. """
         fitness_list = []
         for i, indiv in enumerate(individuos):
             fitness_list.append(Pair(i, indiv.eval_fitness()))
+        fitness_list.sort(key=FITNESS_KEY)
         return fitness_list
 
 ####
 
     def get_best_fitness(self):
-        return min(self._fitness_list).fitness
+        return self._fitness_list[0].fitness
 
 ####
 
     def get_best_index(self):
-        return min(self._fitness_list).indice
+        return self._fitness_list[0].indice
 
 ####
 
@@ -79,13 +92,13 @@ class Poblacion:
         self._bests = []
         i = 0
         while i < maxit:
-            self._fitness_list = sorted(self._compute_fitness_list(self._individuos))
+            self._fitness_list = self._compute_fitness_list(self._individuos)
             mejor_fitness = self.get_best_fitness()
             self._medians.append(self._get_median())
             self._bests.append(mejor_fitness)
             print "Generacion", i
             print "mejor fitness:", mejor_fitness, \
-                  "fitness mediana:", self._fitness_list[self._n/2].fitness,\
+                  "fitness mediana:", self._medians[-1],\
                   "invalidos:", sum(1 for indiv in self._individuos if not indiv._valid),\
                   "promedio longitud", self._average_length()
             print "Mejor individuo:"
@@ -105,7 +118,7 @@ class Poblacion:
     def evolucionar(self):
         n = self._n
         cant_padres = int(round(n * self._brecha_gen))
-        aptitudes = sorted(self._fitness_list)
+        aptitudes = self._fitness_list # ya esta ordenada
 
 
         if (self._elitismo):
@@ -129,7 +142,7 @@ class Poblacion:
         
         if len(self._next_generation) > n:
             ind_eliminar = randint(1 if self._elitismo else 0, n-1)
-            self._next_generation = self._next_generation[:ind_eliminar] + self._next_generation[ind_eliminar+1:]
+            del self._next_generation[ind_eliminar]
             
         
         
@@ -164,17 +177,15 @@ class Poblacion:
         
 ####
     
-    def _mutate(self, genes):
-        if self._tipo_mutacion == 'simple':
+    def _mutate_simple(self, genes):
+        if random() < self._prob_mutacion:
+            index = randint(0, len(genes)-1)
+            genes[index] = randint(0, 255)
+
+    def _mutate_multiple(self, genes):
+        for index in xrange(len(genes)):
             if random() < self._prob_mutacion:
-                index = randint(0, len(genes)-1)
                 genes[index] = randint(0, 255)
-        elif self._tipo_mutacion == 'multiple':
-            for index in xrange(len(genes)):
-                if random() < self._prob_mutacion:
-                    genes[index] = randint(0, 255)
-        else:
-            raise Exception, "Tipo de mutacion invalido: %s" % self._tipo_mutacion
 
 
 
@@ -206,6 +217,8 @@ class Poblacion:
     def _get_median(self):
         median_index = self._n/2
         median = self._fitness_list[median_index].fitness
+        if self._n % 2 == 0:
+            median = (median + self._fitness_list[median_index-1].fitness) / 2.0
         return median
     def _average_length(self):
         return sum(i.length() for i in self._individuos) / float(len(self._individuos))
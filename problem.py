@@ -1,5 +1,4 @@
 from parser import parse_bnf, parse_program
-from copy import deepcopy
 from pylab import subplot, plot, show
 from grammar import Grammar
 import math, scipy, re, sys
@@ -40,7 +39,7 @@ class Problem:
             else:
                 ecuacion += parte
         ecuacion += ")"
-        self._ecuacion = ecuacion 
+        self._ecuacion = compile(ecuacion, '<ecuacion>', 'eval')
 
     def _generar_condiciones(self):
         condiciones = []
@@ -62,14 +61,19 @@ class Problem:
                 else:
                     condicion += parte
             condicion += ")"
-            condiciones.append(condicion)
-        self._condiciones = deepcopy(condiciones)
+            condiciones.append(compile(condicion, '<condicion>', 'eval'))
+        self._condiciones = condiciones
 
 
     def eval_fitness(self, program):
         x = self._lim_inf
         ajuste = 0.0
-        f = lambda x: eval(program)
+        # Se compila una sola vez; f se evalua en cada punto del intervalo
+        try:
+            codigo = compile(program.lstrip(' \t'), '<programa>', 'eval')
+        except:
+            return self._fitness_fail
+        f = lambda x: eval(codigo)
 
         while x <= self._lim_sup:
             try: